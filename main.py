@@ -71,6 +71,12 @@ class Game:
         self.font_large = pygame.font.Font(None, config.FONT_LARGE)
         self.font_medium = pygame.font.Font(None, config.FONT_MEDIUM)
         self.font_small = pygame.font.Font(None, config.FONT_SMALL)
+        self._fonts = {
+            (None, config.FONT_TITLE): self.font_title,
+            (None, config.FONT_LARGE): self.font_large,
+            (None, config.FONT_MEDIUM): self.font_medium,
+            (None, config.FONT_SMALL): self.font_small,
+        }
         
         # db
         self.db = Database()
@@ -100,6 +106,16 @@ class Game:
         # keys being held rn
         self.keys_pressed = set()
 
+    def get_font(self, path, size):
+        """shared font per (path, size) so states that use the same size
+        also share its glyph cache instead of each loading their own."""
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self._fonts[key] = font
+        return font
+
     def _music_track_for_state(self, state_name):
         """Mini-games use game music; menu/title/teacher use background music."""
         if state_name in {'barangay', 'recipe', 'synonym_antonym'}:
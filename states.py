@@ -8,6 +8,7 @@ import math
 import config
 from database import Database
 from tilemap import Tilemap, Player
+from textcache import TEXT_CACHE_LIMIT, render_cached
 
 # giant dev footnotes for this monster file:
 # - yes this file is huge. splitting later would be nice but not today.
@@ -130,6 +131,14 @@ def sanitize_student_id(raw_text):
     return cleaned[:24]
 
 
+# wrapped lines shared by every state (see State.wrap_text_pixel),
+# bounded by the same limit as the rendered text in textcache.py
+_WRAP_CACHE = {}
+
+# pre-baked "select language" panels, see State.draw_language_selection
+_LANGUAGE_PANELS = {}
+
+
 # Base state (other states inherit from this)
 
 class State:
@@ -162,33 +171,116 @@ class State:
 
     @staticmethod
     def wrap_text_pixel(text, max_width, font):
-        """wrap text so it fits on screen"""
-        words = text.split()
+        """wrap text so it fits on screen.
+
+        results are cached per (text, width, font) since the same question text
+        gets wrapped every frame. each candidate line is still measured whole,
+        adding up word widths drifts off by a few px once kerning kicks in.
+        """
+        key = (text, max_width, font)
+        cached = _WRAP_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         lines = []
         current_line = ''
-        for word in words:
-            test_line = f'{current_line} {word}' if current_line else word
-            if font.size(test_line)[0] <= max_width:
-                current_line = test_line
+        for word in text.split():
+            if current_line:
+                test_line = f'{current_line} {word}'
+                if font.size(test_line)[0] <= max_width:
+                    current_line = test_line
+                    continue
+                lines.append(current_line)
+            if font.size(word)[0] > max_width:
+                lines.append(word)              # force-add oversized word
+                current_line = ''
             else:
-                if current_line:
-                    lines.append(current_line)
-                if font.size(word)[0] > max_width:
-                    lines.append(word)          # force-add oversized word
-                    current_line = ''
-                else:
-                    current_line = word
+                current_line = word
         if current_line:
             lines.append(current_line)
+
+        if len(_WRAP_CACHE) >= TEXT_CACHE_LIMIT:
+            _WRAP_CACHE.clear()
+        lines = tuple(lines)
+        _WRAP_CACHE[key] = lines
         return lines
 
+    @staticmethod
+    def wrap_text_balanced(text, max_width, font):
+        """wrap static text so lines come out even instead of ragged.
+
+        same line count as wrap_text_pixel (greedy is already the minimum),
+        but breaks are picked to minimise the squared leftover space per line
+        so we dont get one lonely word hanging on a line. small dp, cached.
+        """
+        key = (text, max_width, font, 'balanced')
+        cached = _WRAP_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        greedy = State.wrap_text_pixel(text, max_width, font)
+        if len(greedy) <= 1:
+            return greedy
+
+        words = text.split()
+        count = len(words)
+
+        # best[j] = (line count, cost, start of last line) for the first j words.
+        # every span is measured whole, same as wrap_text_pixel, so kerning
+        # cant push a balanced line past max_width.
+        best = [(0, 0, 0)] + [None] * count
+        for j in range(1, count + 1):
+            for i in range(j - 1, -1, -1):
+                line_w = font.size(' '.join(words[i:j]))[0]
+                if line_w > max_width and i < j - 1:
+                    break
+                # the last line counts too, thats what stops one lonely word
+                # hanging there. oversized single words just get slack 0.
+                slack = max(0, max_width - line_w)
+                candidate = (best[i][0] + 1, best[i][1] + slack * slack, i)
+                if best[j] is None or candidate[:2] < best[j][:2]:
+                    best[j] = candidate
+
+        lines = []
+        j = count
+        while j > 0:
+            i = best[j][2]
+            lines.append(' '.join(words[i:j]))
+            j = i
+
+        if len(_WRAP_CACHE) >= TEXT_CACHE_LIMIT:
+            _WRAP_CACHE.clear()
+        lines = tuple(reversed(lines))
+        _WRAP_CACHE[key] = lines
+        return lines
+
+    @staticmethod
+    def render_centered(font, text, color, center):
+        """render text once and work out the top-left that centers it,
+        so static labels can be blitted without a get_rect every frame."""
+        surf = font.render(text, True, color)
+        return surf, (center[0] - surf.get_width() // 2, center[1] - surf.get_height() // 2)
+
     @staticmethod
     def create_gradient(width, height, color_func):
-        """make a gradient background surface"""
-        surface = pygame.Surface((width, height))
+        """make a gradient background surface.
+        fills a 1px wide column and stretches it once, instead of a
+        full-width line draw per row."""
+        column = pygame.Surface((1, height))
+        set_at = column.set_at
         for i in range(height):
-            pygame.draw.line(surface, color_func(i), (0, i), (width - 1, i))
-        return surface
+            set_at((0, i), color_func(i))
+        surface = pygame.transform.scale(column, (width, height))
+        return State.to_display_format(surface)
+
+    @staticmethod
+    def to_display_format(surface, alpha=False):
+        """convert a static surface to the display's pixel format once,
+        so every later blit takes the fast path instead of converting again.
+        skipped when there's no display yet."""
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
 
     @staticmethod
     def draw_retro_box(screen, rect, bg_color, border_color=None,
@@ -201,17 +293,38 @@ class State:
             pygame.draw.rect(screen, border_color, rect, border_width)
 
     def draw_language_selection(self, screen, title_color):
-        """show the pick a language screen"""
-        title_box = pygame.Rect(config.SCREEN_WIDTH // 2 - 300, 100, 600, 80)
-        self.draw_retro_box(screen, title_box, title_color, config.YELLOW,
+        """show the pick a language screen.
+
+        the whole panel never changes, so it gets drawn once onto a
+        transparent surface (per color + fonts + screen width) and just
+        blitted over the background after that.
+        """
+        key = (title_color, self.title_font, self.font, self.small_font,
+               config.SCREEN_WIDTH)
+        cached = _LANGUAGE_PANELS.get(key)
+        if cached is None:
+            cached = self._build_language_panel(title_color)
+            _LANGUAGE_PANELS[key] = cached
+        screen.blit(*cached)
+
+    def _build_language_panel(self, title_color):
+        """bake the language screen onto one surface, returns (surface, pos)"""
+        cx = config.SCREEN_WIDTH // 2
+        # covers the title box shadow down to the hint line
+        bounds = pygame.Rect(cx - 310, 90, 620, 520)
+        panel = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        dx, dy = -bounds.x, -bounds.y
+
+        title_box = pygame.Rect(cx - 300 + dx, 100 + dy, 600, 80)
+        self.draw_retro_box(panel, title_box, title_color, config.YELLOW,
                             border_width=5)
 
         title = self.title_font.render('SELECT LANGUAGE', True, config.YELLOW)
         title_shadow = self.title_font.render('SELECT LANGUAGE', True,
                                               config.BLACK)
         title_rect = title.get_rect(center=title_box.center)
-        screen.blit(title_shadow, title_rect.move(3, 3))
-        screen.blit(title, title_rect)
+        panel.blit(title_shadow, title_rect.move(3, 3))
+        panel.blit(title, title_rect)
 
         languages = [
             ('1. ENGLISH',        config.GREEN),
@@ -221,19 +334,20 @@ class State:
 
         y = 250
         for lang_text, color in languages:
-            lang_box = pygame.Rect(config.SCREEN_WIDTH // 2 - 250, y, 500, 70)
-            self.draw_retro_box(screen, lang_box, color, config.YELLOW,
+            lang_box = pygame.Rect(cx - 250 + dx, y + dy, 500, 70)
+            self.draw_retro_box(panel, lang_box, color, config.YELLOW,
                                 border_width=4)
             text = self.font.render(lang_text, True, config.WHITE)
             text_shadow = self.font.render(lang_text, True, config.BLACK)
             text_rect = text.get_rect(center=lang_box.center)
-            screen.blit(text_shadow, text_rect.move(2, 2))
-            screen.blit(text, text_rect)
+            panel.blit(text_shadow, text_rect.move(2, 2))
+            panel.blit(text, text_rect)
             y += 90
 
         hint = self.small_font.render('Press the number key to select', True,
                                       config.WHITE)
-        screen.blit(hint, hint.get_rect(center=(config.SCREEN_WIDTH // 2, 580)))
+        panel.blit(hint, hint.get_rect(center=(cx + dx, 580 + dy)))
+        return self.to_display_format(panel, alpha=True), bounds.topleft
 
     @staticmethod
     def handle_language_key(event):
@@ -297,6 +411,7 @@ class TitleScreenState(State):
         self.bg_gradient = None
         self.scanlines = None
         self.vignette = None
+        self.fade = None
         self.layout_size = (0, 0)
 
         self.parallax_rows = []
@@ -352,6 +467,7 @@ class TitleScreenState(State):
         for y in range(0, h, 3):
             alpha = 18 + ((y // 3) % 3) * 5
             pygame.draw.line(self.scanlines, (0, 0, 0, alpha), (0, y), (w, y))
+        self.scanlines = self.to_display_format(self.scanlines, alpha=True)
 
         self.vignette = pygame.Surface((w, h), pygame.SRCALPHA)
         edge_band = max(34, min(w, h) // 7)
@@ -361,6 +477,12 @@ class TitleScreenState(State):
             if rect.w <= 0 or rect.h <= 0:
                 break
             pygame.draw.rect(self.vignette, (0, 0, 0, alpha), rect, 1)
+        self.vignette = self.to_display_format(self.vignette, alpha=True)
+
+        # reused for the intro fade instead of allocating one every frame
+        self.fade = pygame.Surface((w, h))
+        self.fade.fill(config.BLACK)
+        self.fade = self.to_display_format(self.fade)
 
         self.title_image = self._fit_image(self.title_raw, int(w * 0.8), int(h * 0.5))
 
@@ -600,10 +722,8 @@ class TitleScreenState(State):
 
         intro_time = time.time() - self.entered_at
         if intro_time < 0.9:
-            fade = pygame.Surface((w, h))
-            fade.fill(config.BLACK)
-            fade.set_alpha(int(255 * (1.0 - (intro_time / 0.9))))
-            screen.blit(fade, (0, 0))
+            self.fade.set_alpha(int(255 * (1.0 - (intro_time / 0.9))))
+            screen.blit(self.fade, (0, 0))
 
 
 # Menu (the overworld map)
@@ -813,10 +933,9 @@ class MenuState(State):
         self.prompt_timer += dt
 
     def _draw_student_box(self, screen):
-        tag = self.game.font_small.render(
-            f'PLAYER ID: {self.student_id}  |  TAB: PROFILES', True, config.WHITE)
-        sh = self.game.font_small.render(
-            f'PLAYER ID: {self.student_id}  |  TAB: PROFILES', True, config.BLACK)
+        tag_text = f'PLAYER ID: {self.student_id}  |  TAB: PROFILES'
+        tag = render_cached(self.game.font_small, tag_text, config.WHITE)
+        sh = render_cached(self.game.font_small, tag_text, config.BLACK)
         rect = tag.get_rect(topleft=(20, 55))
         box = rect.inflate(22, 14)
         pygame.draw.rect(screen, config.BLACK, box.move(2, 2))
@@ -884,7 +1003,7 @@ class MenuState(State):
         screen.blit(hint, hint.get_rect(center=(config.SCREEN_WIDTH // 2, modal.y + 400)))
 
     def draw(self, screen):
-        screen.fill((135, 206, 235))
+        screen.fill(self.tilemap.BACKGROUND)
         self.tilemap.draw_back(screen, self.camera_x, self.camera_y)
         self.player.draw(screen, self.camera_x, self.camera_y)
         self.tilemap.draw_front(screen, self.camera_x, self.camera_y)
@@ -907,8 +1026,8 @@ class MenuState(State):
                 'synonym_antonym': 'Word Match Game',
             }
             prompt_str = f"Press SPACE to enter {zone_names.get(self.interaction_prompt, '')}"
-            text = self.game.font_medium.render(prompt_str, True, config.WHITE)
-            text_shadow = self.game.font_medium.render(prompt_str, True, config.BLACK)
+            text = render_cached(self.game.font_medium, prompt_str, config.WHITE)
+            text_shadow = render_cached(self.game.font_medium, prompt_str, config.BLACK)
 
             sw = int((text.get_width() + 40) * scale)
             sh = int((text.get_height() + 20) * scale)
@@ -925,12 +1044,9 @@ class MenuState(State):
             screen.blit(text, tr)
 
         # controls hint at the top
-        ctrl = self.game.font_small.render(
-            'Arrow Keys / WASD: Move | SPACE: Interact | TAB: Profiles',
-            True, config.WHITE)
-        ctrl_s = self.game.font_small.render(
-            'Arrow Keys / WASD: Move | SPACE: Interact | TAB: Profiles',
-            True, config.BLACK)
+        ctrl_text = 'Arrow Keys / WASD: Move | SPACE: Interact | TAB: Profiles'
+        ctrl = render_cached(self.game.font_small, ctrl_text, config.WHITE)
+        ctrl_s = render_cached(self.game.font_small, ctrl_text, config.BLACK)
         cr = ctrl.get_rect(center=(config.SCREEN_WIDTH // 2, 30))
         bg = cr.inflate(20, 10)
         pygame.draw.rect(screen, config.BLACK, bg.move(2, 2))
@@ -942,10 +1058,9 @@ class MenuState(State):
         self._draw_student_box(screen)
 
         # gems counter
-        stxt = self.game.font_medium.render(
-            f"Total Gems: {self.stats['total_gems']}", True, config.YELLOW)
-        sshd = self.game.font_medium.render(
-            f"Total Gems: {self.stats['total_gems']}", True, config.BLACK)
+        gems_text = f"Total Gems: {self.stats['total_gems']}"
+        stxt = render_cached(self.game.font_medium, gems_text, config.YELLOW)
+        sshd = render_cached(self.game.font_medium, gems_text, config.BLACK)
         sr = stxt.get_rect(topright=(config.SCREEN_WIDTH - 20, 20))
         sbg = sr.inflate(20, 10)
         pygame.draw.rect(screen, config.BLACK, sbg.move(2, 2))
@@ -971,9 +1086,9 @@ class TeacherDashboardState(State):
 
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.Font(None, config.FONT_MEDIUM)
-        self.small_font = pygame.font.Font(None, config.FONT_SMALL)
-        self.title_font = pygame.font.Font(None, config.FONT_LARGE)
+        self.font = game.font_medium
+        self.small_font = game.font_small
+        self.title_font = game.font_large
         self.report = None
         self.authenticated = False
         self.password_input = ''
@@ -2150,9 +2265,9 @@ class BarangayCaptainState(State):
 
     def __init__(self, game):
         super().__init__(game)
-        self.font       = pygame.font.Font(config.FONT_PATH, 24)
-        self.title_font = pygame.font.Font(config.FONT_PATH, 36)
-        self.small_font = pygame.font.Font(config.FONT_PATH, 18)
+        self.font       = game.get_font(config.FONT_PATH, 24)
+        self.title_font = game.get_font(config.FONT_PATH, 36)
+        self.small_font = game.get_font(config.FONT_PATH, 18)
         self.current_question = 0
         self.score = 0
         self.happiness = 50
@@ -2170,6 +2285,8 @@ class BarangayCaptainState(State):
         self.use_custom_questions = False
         self.active_difficulty_mode = 'General'
         self._cached_dimensions = None
+        self._rects = {}
+        self._titles = {}
 
     def enter(self):
         self.current_question = 0
@@ -2277,7 +2394,7 @@ class BarangayCaptainState(State):
                 if idx < len(q['choices']):
                     self.selected_choice = idx
                     self.show_result = True
-                    self.result_timer = time.time()
+                    self.result_timer = pygame.time.get_ticks()
                     if idx == q['correct']:
                         self.score += 1
                         self.feedback = "Correct! Good reading comprehension."
@@ -2293,7 +2410,7 @@ class BarangayCaptainState(State):
         if not self.questions:
             return
 
-        if self.show_result and time.time() - self.result_timer > 2:
+        if self.show_result and pygame.time.get_ticks() - self.result_timer > 2000:
             self.current_question += 1
             if self.current_question >= len(self.questions):
                 self.game_finished = True
@@ -2312,6 +2429,8 @@ class BarangayCaptainState(State):
                 lambda i: (int(30 + i / h * 40),
                            int(30 + i / h * 40),
                            int(30 + i / h * 40) + 80))
+            self._rects = self._build_layout()
+            self._titles = self._build_titles()
             self._cached_dimensions = current_dims
         
         screen.blit(self._gradient_bg, (0, 0))
@@ -2337,22 +2456,47 @@ class BarangayCaptainState(State):
 
     # --- private draw helpers ---
 
+    def _build_layout(self):
+        """the boxes that don't move, built once per screen size."""
+        w = config.SCREEN_WIDTH
+        info_y = 110
+        return {
+            'title': pygame.Rect(20, 20, w - 40, 70),
+            'progress': pygame.Rect(30, info_y, 200, 50),
+            'happiness': pygame.Rect(250, info_y, 400, 50),
+            'score': pygame.Rect(670, info_y, 320, 50),
+            'passage': pygame.Rect(40, 190, w - 80, 180),
+            'no_questions': pygame.Rect(w // 2 - 360, 220, 720, 280),
+            'game_over': pygame.Rect(w // 2 - 300, 150, 600, 400),
+            'score_stat': pygame.Rect(w // 2 - 250, 320, 500, 60),
+            'happiness_stat': pygame.Rect(w // 2 - 250, 400, 500, 60),
+        }
+
+    def _build_titles(self):
+        """headings + their drop shadows, rendered once per screen size."""
+        cx = config.SCREEN_WIDTH // 2
+        titles = {}
+        for name, text, cy in (('question', 'BARANGAY CAPTAIN', 55),
+                               ('game_over', 'MISSION COMPLETE!', 220)):
+            surf, (x, y) = self.render_centered(self.title_font, text, config.YELLOW, (cx, cy))
+            shadow = self.title_font.render(text, True, config.BLACK)
+            titles[name] = ((shadow, (x + 3, y + 3)), (surf, (x, y)))
+        return titles
+
     def _draw_question(self, screen):
         q = self._active_question()
+        r = self._rects
 
         # Title
-        title_box = pygame.Rect(20, 20, config.SCREEN_WIDTH - 40, 70)
-        self.draw_retro_box(screen, title_box, config.BLUE, config.YELLOW,
+        self.draw_retro_box(screen, r['title'], config.BLUE, config.YELLOW,
                             border_width=4)
-        t = self.title_font.render('BARANGAY CAPTAIN', True, config.YELLOW)
-        ts = self.title_font.render('BARANGAY CAPTAIN', True, config.BLACK)
-        tr = t.get_rect(center=(config.SCREEN_WIDTH // 2, 55))
-        screen.blit(ts, tr.move(3, 3)); screen.blit(t, tr)
+        for surf, pos in self._titles['question']:
+            screen.blit(surf, pos)
 
         info_y = 110
 
         # Progress
-        self.draw_retro_box(screen, pygame.Rect(30, info_y, 200, 50),
+        self.draw_retro_box(screen, r['progress'],
                             config.DARK_GRAY, config.WHITE)
         pt = self.small_font.render(
             f'Question {self.current_question + 1}/{len(self.questions)}',
@@ -2360,8 +2504,7 @@ class BarangayCaptainState(State):
         screen.blit(pt, (40, info_y + 15))
 
         # Happiness bar
-        hbox = pygame.Rect(250, info_y, 400, 50)
-        self.draw_retro_box(screen, hbox, config.DARK_GRAY, config.WHITE)
+        self.draw_retro_box(screen, r['happiness'], config.DARK_GRAY, config.WHITE)
         bw = int(self.happiness / 100 * 360)
         bc = (config.GREEN if self.happiness >= 70
               else config.YELLOW if self.happiness >= 40
@@ -2373,15 +2516,13 @@ class BarangayCaptainState(State):
         screen.blit(ht, (270, info_y + 15))
 
         # Score
-        sbox = pygame.Rect(670, info_y, 320, 50)
-        self.draw_retro_box(screen, sbox, config.DARK_GRAY, config.WHITE)
+        self.draw_retro_box(screen, r['score'], config.DARK_GRAY, config.WHITE)
         st = self.small_font.render(f'Correct: {self.score}', True,
                                     config.YELLOW)
         screen.blit(st, (690, info_y + 15))
 
         # Passage
-        pbox = pygame.Rect(40, 190, config.SCREEN_WIDTH - 80, 180)
-        self.draw_retro_box(screen, pbox, config.WHITE, config.BLACK,
+        self.draw_retro_box(screen, r['passage'], config.WHITE, config.BLACK,
                             border_width=4)
         p_lines = self.wrap_text_pixel(q['passage'],
                                        config.SCREEN_WIDTH - 120, self.font)
@@ -2449,8 +2590,7 @@ class BarangayCaptainState(State):
             screen.blit(rt, rt.get_rect(center=rbox.center))
 
     def _draw_no_questions(self, screen):
-        box = pygame.Rect(config.SCREEN_WIDTH // 2 - 360, 220, 720, 280)
-        self.draw_retro_box(screen, box, config.BLUE, config.YELLOW,
+        self.draw_retro_box(screen, self._rects['no_questions'], config.BLUE, config.YELLOW,
                             border_width=6)
         title = self.title_font.render('NO QUESTIONS FOUND', True, config.YELLOW)
         screen.blit(title, title.get_rect(center=(config.SCREEN_WIDTH // 2, 280)))
@@ -2467,27 +2607,24 @@ class BarangayCaptainState(State):
         screen.blit(line3, line3.get_rect(center=(config.SCREEN_WIDTH // 2, 432)))
 
     def _draw_game_over(self, screen):
-        gobox = pygame.Rect(config.SCREEN_WIDTH // 2 - 300, 150, 600, 400)
-        self.draw_retro_box(screen, gobox, config.BLUE, config.YELLOW,
+        r = self._rects
+        self.draw_retro_box(screen, r['game_over'], config.BLUE, config.YELLOW,
                             border_width=6)
 
-        et = self.title_font.render('MISSION COMPLETE!', True, config.YELLOW)
-        es = self.title_font.render('MISSION COMPLETE!', True, config.BLACK)
-        er = et.get_rect(center=(config.SCREEN_WIDTH // 2, 220))
-        screen.blit(es, er.move(3, 3)); screen.blit(et, er)
+        for surf, pos in self._titles['game_over']:
+            screen.blit(surf, pos)
 
         total = max(1, len(self.questions))
         ratio = self.score / total
-        sy = 320
 
-        ssbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 250, sy, 500, 60)
+        ssbox = r['score_stat']
         sc = config.GREEN if ratio >= 0.7 else config.ORANGE
         self.draw_retro_box(screen, ssbox, sc, config.WHITE)
         st = self.font.render(f'Correct Answers: {self.score}/{total}', True,
                               config.WHITE)
         screen.blit(st, st.get_rect(center=ssbox.center))
 
-        hsbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 250, sy + 80, 500, 60)
+        hsbox = r['happiness_stat']
         hc = (config.GREEN if self.happiness >= 70
               else config.YELLOW if self.happiness >= 40
               else config.RED)
@@ -2517,9 +2654,9 @@ class RecipeGameState(State):
 
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.Font(config.FONT_PATH, 24)
-        self.title_font = pygame.font.Font(config.FONT_PATH, 36)
-        self.small_font = pygame.font.Font(config.FONT_PATH, 18)
+        self.font = game.get_font(config.FONT_PATH, 24)
+        self.title_font = game.get_font(config.FONT_PATH, 36)
+        self.small_font = game.get_font(config.FONT_PATH, 18)
 
         self.current_question = 0
         self.score = 0
@@ -2542,7 +2679,13 @@ class RecipeGameState(State):
         self.selected_recipe_key = None
         self.recipe_shown = False
 
+        # per-recipe constants, refreshed in _select_recipe so draw doesnt redo them
+        self._recipe_title = ''
+        self._num_questions = 0
+        self._recipe_panels = None
+
         self._cached_dimensions = None
+        self._rects = {}
 
     @staticmethod
     def _normalize_recipe_key(value):
@@ -2582,6 +2725,9 @@ class RecipeGameState(State):
         self.recipe_select_index = 0
         self.selected_recipe_key = None
         self.recipe_shown = False
+        self._recipe_title = ''
+        self._num_questions = 0
+        self._recipe_panels = None
 
     def _load_custom_questions(self):
         self.active_difficulty_mode = self.game.db.get_selected_difficulty_mode(
@@ -2639,6 +2785,9 @@ class RecipeGameState(State):
         ]
         random.shuffle(pool)
         self.recipe_questions = pool
+        self._num_questions = len(pool)
+        self._recipe_title = RECIPE_DATA.get(recipe_key, RECIPE_DATA['tinola'])['title'].upper()
+        self._recipe_panels = None
 
     def _questions(self):
         return self.recipe_questions
@@ -2747,7 +2896,7 @@ class RecipeGameState(State):
             if idx < len(q['choices']):
                 self.selected_choice = idx
                 self.show_result = True
-                self.result_timer = time.time()
+                self.result_timer = pygame.time.get_ticks()
                 if idx == q['answer']:
                     self.score += 1
 
@@ -2755,9 +2904,9 @@ class RecipeGameState(State):
         if not self.recipe_questions:
             return
 
-        if self.show_result and time.time() - self.result_timer > 2:
+        if self.show_result and pygame.time.get_ticks() - self.result_timer > 2000:
             self.current_question += 1
-            if self.current_question >= len(self.recipe_questions):
+            if self.current_question >= self._num_questions:
                 self.game_finished = True
                 self.show_result = False
             else:
@@ -2777,6 +2926,8 @@ class RecipeGameState(State):
                     max(0, min(255, int(220 + i / h * 35) - 80)),
                 ),
             )
+            self._rects = self._build_layout()
+            self._recipe_panels = None
             self._cached_dimensions = current_dims
 
         screen.blit(self._gradient_bg, (0, 0))
@@ -2810,14 +2961,34 @@ class RecipeGameState(State):
 
         if self.game_finished:
             self._draw_complete(screen, recipe)
-        elif self.current_question < len(self.recipe_questions):
+        elif self.current_question < self._num_questions:
             self._draw_quiz(screen, recipe)
         else:
             self._draw_complete(screen, recipe)
 
+    def _build_layout(self):
+        """the boxes that don't move, built once per screen size."""
+        w, h = config.SCREEN_WIDTH, config.SCREEN_HEIGHT
+        return {
+            'no_questions': pygame.Rect(w // 2 - 390, 210, 780, 320),
+            'select_top': pygame.Rect(30, 30, w - 60, 90),
+            'select_bottom': pygame.Rect(w // 2 - 470, h - 90, 940, 52),
+            'card_header': pygame.Rect(30, 30, w - 60, 92),
+            'ingredients': pygame.Rect(40, 140, 460, 520),
+            'ingredients_head': pygame.Rect(50, 150, 440, 42),
+            'directions': pygame.Rect(520, 140, 470, 520),
+            'directions_head': pygame.Rect(530, 150, 450, 42),
+            'card_prompt': pygame.Rect(w // 2 - 380, h - 84, 760, 56),
+            'quiz_title': pygame.Rect(30, 30, w - 60, 70),
+            'progress': pygame.Rect(30, 120, 250, 45),
+            'score': pygame.Rect(w - 230, 120, 200, 45),
+            'quiz_prompt': pygame.Rect(50, 190, w - 100, 90),
+            'complete': pygame.Rect(w // 2 - 320, 200, 640, 350),
+            'score_stat': pygame.Rect(w // 2 - 250, 350, 500, 80),
+        }
+
     def _draw_no_questions(self, screen, recipe_key=None):
-        box = pygame.Rect(config.SCREEN_WIDTH // 2 - 390, 210, 780, 320)
-        self.draw_retro_box(screen, box, config.ORANGE, config.YELLOW, border_width=6)
+        self.draw_retro_box(screen, self._rects['no_questions'], config.ORANGE, config.YELLOW, border_width=6)
         title = self.title_font.render('NO QUESTIONS FOUND', True, config.WHITE)
         screen.blit(title, title.get_rect(center=(config.SCREEN_WIDTH // 2, 270)))
 
@@ -2855,8 +3026,7 @@ class RecipeGameState(State):
             screen.blit(line3, line3.get_rect(center=(config.SCREEN_WIDTH // 2, 430)))
 
     def _draw_recipe_selection(self, screen):
-        top = pygame.Rect(30, 30, config.SCREEN_WIDTH - 60, 90)
-        self.draw_retro_box(screen, top, config.ORANGE, config.YELLOW, border_width=5)
+        self.draw_retro_box(screen, self._rects['select_top'], config.ORANGE, config.YELLOW, border_width=5)
         title = self.title_font.render('CHOOSE A RECIPE', True, config.WHITE)
         subtitle = self.small_font.render(
             f'Active Profile: {self.active_difficulty_mode} (applies to all games)',
@@ -2902,7 +3072,7 @@ class RecipeGameState(State):
             hint = self.small_font.render('Includes generic recipe rows too', True, config.LIGHT_BLUE)
             screen.blit(hint, (rect.x + 72, rect.y + 104))
 
-        bottom = pygame.Rect(config.SCREEN_WIDTH // 2 - 470, config.SCREEN_HEIGHT - 90, 940, 52)
+        bottom = self._rects['select_bottom']
         self.draw_retro_box(screen, bottom, config.BLUE, config.YELLOW, border_width=4)
         instruction = self.small_font.render(
             'Use 1-4 or Arrow Keys, then ENTER/SPACE to view instructions for your selected recipe.',
@@ -2912,91 +3082,100 @@ class RecipeGameState(State):
         screen.blit(instruction, instruction.get_rect(center=bottom.center))
 
     def _draw_recipe_card(self, screen, recipe):
-        hbox = pygame.Rect(30, 30, config.SCREEN_WIDTH - 60, 92)
-        self.draw_retro_box(screen, hbox, config.ORANGE, config.YELLOW, border_width=5)
-        title = self.title_font.render(recipe['title'].upper(), True, config.WHITE)
-        description = self.small_font.render(recipe['description'], True, config.LIGHT_BLUE)
-        screen.blit(title, title.get_rect(center=(config.SCREEN_WIDTH // 2, 66)))
-        screen.blit(description, description.get_rect(center=(config.SCREEN_WIDTH // 2, 98)))
-
-        ibox = pygame.Rect(40, 140, 460, 520)
-        self.draw_retro_box(screen, ibox, (255, 250, 230), config.ORANGE, border_width=4)
-        ihead = pygame.Rect(50, 150, 440, 42)
-        self.draw_retro_box(screen, ihead, config.ORANGE, config.YELLOW, shadow=False, border_width=3)
-        it = self.font.render('INGREDIENTS', True, config.WHITE)
-        screen.blit(it, it.get_rect(center=ihead.center))
-
+        r = self._rects
+        if self._recipe_panels is None:
+            self._recipe_panels = self._build_recipe_panels(recipe)
+        blits, prompt = self._recipe_panels
+
+        self.draw_retro_box(screen, r['card_header'], config.ORANGE, config.YELLOW, border_width=5)
+        for surf, pos in blits:
+            screen.blit(surf, pos)
+
+        fill = config.BLUE if self.recipe_questions else config.RED
+        self.draw_retro_box(screen, r['card_prompt'], fill, config.YELLOW, border_width=4)
+        screen.blit(*prompt)
+
+    def _bake_card_panel(self, box, head, title):
+        """draw one recipe card panel (shadow, box and header) onto its own
+        surface. returns the surface, where it goes on screen, and the
+        (dx, dy) to shift screen coords into the surface."""
+        bounds = box.union(box.inflate(6, 6).move(2, 2))
+        dx, dy = -bounds.x, -bounds.y
+        surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self.draw_retro_box(surf, box.move(dx, dy), (255, 250, 230), config.ORANGE, border_width=4)
+        head = head.move(dx, dy)
+        self.draw_retro_box(surf, head, config.ORANGE, config.YELLOW, shadow=False, border_width=3)
+        text = self.font.render(title, True, config.WHITE)
+        surf.blit(text, text.get_rect(center=head.center))
+        return surf, bounds.topleft, dx, dy
+
+    def _build_recipe_panels(self, recipe):
+        """pre-render the ingredients and directions panels plus the card's
+        fixed text. none of it changes once a recipe is picked, so the card
+        just blits the cached (surface, pos) pairs."""
+        r = self._rects
+        cx = config.SCREEN_WIDTH // 2
+
+        isurf, ipos, dx, dy = self._bake_card_panel(r['ingredients'], r['ingredients_head'], 'INGREDIENTS')
         y = 210
         for item in recipe['ingredients']:
-            pygame.draw.circle(screen, config.ORANGE, (70, y + 9), 5)
-            screen.blit(self.small_font.render(item, True, config.BLACK), (84, y))
+            pygame.draw.circle(isurf, config.ORANGE, (70 + dx, y + 9 + dy), 5)
+            isurf.blit(self.small_font.render(item, True, config.BLACK), (84 + dx, y + dy))
             y += 30
 
-        dbox = pygame.Rect(520, 140, 470, 520)
-        self.draw_retro_box(screen, dbox, (255, 250, 230), config.ORANGE, border_width=4)
-        dhead = pygame.Rect(530, 150, 450, 42)
-        self.draw_retro_box(screen, dhead, config.ORANGE, config.YELLOW, shadow=False, border_width=3)
-        dt = self.font.render('DIRECTIONS', True, config.WHITE)
-        screen.blit(dt, dt.get_rect(center=dhead.center))
-
+        dsurf, dpos, dx, dy = self._bake_card_panel(r['directions'], r['directions_head'], 'DIRECTIONS')
         y = 210
         for i, step in enumerate(recipe['directions'], 1):
-            tag = pygame.Rect(535, y, 26, 26)
-            self.draw_retro_box(screen, tag, config.ORANGE, config.YELLOW, shadow=False, border_width=2)
+            tag = pygame.Rect(535 + dx, y + dy, 26, 26)
+            self.draw_retro_box(dsurf, tag, config.ORANGE, config.YELLOW, shadow=False, border_width=2)
             num = self.small_font.render(str(i), True, config.WHITE)
-            screen.blit(num, num.get_rect(center=tag.center))
+            dsurf.blit(num, num.get_rect(center=tag.center))
 
-            lines = self.wrap_text_pixel(step, 390, self.small_font)
+            lines = self.wrap_text_balanced(step, 390, self.small_font)
             ty = y
             for line in lines:
-                screen.blit(self.small_font.render(line, True, config.BLACK), (570, ty))
+                dsurf.blit(self.small_font.render(line, True, config.BLACK), (570 + dx, ty + dy))
                 ty += 22
             y += max(30, len(lines) * 22 + 4)
 
-        pbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 380, config.SCREEN_HEIGHT - 84, 760, 56)
         if self.recipe_questions:
-            self.draw_retro_box(screen, pbox, config.BLUE, config.YELLOW, border_width=4)
-            prompt = self.small_font.render(
-                'Press SPACE/ENTER to start quiz. BACKSPACE to choose a different recipe.',
-                True,
-                config.WHITE,
-            )
+            prompt_text = 'Press SPACE/ENTER to start quiz. BACKSPACE to choose a different recipe.'
         else:
-            self.draw_retro_box(screen, pbox, config.RED, config.YELLOW, border_width=4)
-            prompt = self.small_font.render(
-                'No questions for this recipe in this profile. BACKSPACE to pick another recipe.',
-                True,
-                config.WHITE,
-            )
-        screen.blit(prompt, prompt.get_rect(center=pbox.center))
+            prompt_text = 'No questions for this recipe in this profile. BACKSPACE to pick another recipe.'
+
+        blits = [
+            self.render_centered(self.title_font, self._recipe_title, config.WHITE, (cx, 66)),
+            self.render_centered(self.small_font, recipe['description'], config.LIGHT_BLUE, (cx, 98)),
+            (self.to_display_format(isurf, alpha=True), ipos),
+            (self.to_display_format(dsurf, alpha=True), dpos),
+        ]
+        prompt = self.render_centered(self.small_font, prompt_text, config.WHITE, r['card_prompt'].center)
+        return blits, prompt
 
     def _draw_quiz(self, screen, recipe):
         q = self.recipe_questions[self.current_question]
+        r = self._rects
 
-        tbox = pygame.Rect(30, 30, config.SCREEN_WIDTH - 60, 70)
-        self.draw_retro_box(screen, tbox, config.ORANGE, config.YELLOW, border_width=4)
-        title = self.title_font.render(f"{recipe['title'].upper()} QUIZ", True, config.WHITE)
+        self.draw_retro_box(screen, r['quiz_title'], config.ORANGE, config.YELLOW, border_width=4)
+        title = self.title_font.render(f'{self._recipe_title} QUIZ', True, config.WHITE)
         screen.blit(title, title.get_rect(center=(config.SCREEN_WIDTH // 2, 65)))
 
-        pbox = pygame.Rect(30, 120, 250, 45)
-        self.draw_retro_box(screen, pbox, config.DARK_GRAY, config.WHITE)
+        self.draw_retro_box(screen, r['progress'], config.DARK_GRAY, config.WHITE)
         ptxt = self.small_font.render(
-            f'Question {self.current_question + 1}/{len(self.recipe_questions)}',
+            f'Question {self.current_question + 1}/{self._num_questions}',
             True,
             config.WHITE,
         )
         screen.blit(ptxt, (40, 132))
 
-        sbox = pygame.Rect(config.SCREEN_WIDTH - 230, 120, 200, 45)
-        self.draw_retro_box(screen, sbox, config.DARK_GRAY, config.WHITE)
+        self.draw_retro_box(screen, r['score'], config.DARK_GRAY, config.WHITE)
         stxt = self.small_font.render(f'Score: {self.score}', True, config.YELLOW)
         screen.blit(stxt, (config.SCREEN_WIDTH - 210, 132))
 
         prompt_text = q.get('prompt', '').strip()
         question_y = 190
         if prompt_text:
-            pbox = pygame.Rect(50, 190, config.SCREEN_WIDTH - 100, 90)
-            self.draw_retro_box(screen, pbox, config.LIGHT_BLUE, config.ORANGE, border_width=4)
+            self.draw_retro_box(screen, r['quiz_prompt'], config.LIGHT_BLUE, config.ORANGE, border_width=4)
             lines = self.wrap_text_pixel(prompt_text, config.SCREEN_WIDTH - 160, self.small_font)
             py = 205
             for line in lines[:3]:
@@ -3053,17 +3232,18 @@ class RecipeGameState(State):
             screen.blit(rt, rt.get_rect(center=rbox.center))
 
     def _draw_complete(self, screen, recipe):
-        cbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 320, 200, 640, 350)
-        self.draw_retro_box(screen, cbox, config.ORANGE, config.YELLOW, border_width=6)
-        title = self.title_font.render(f"{recipe['title'].upper()} COMPLETE!", True, config.WHITE)
-        shadow = self.title_font.render(f"{recipe['title'].upper()} COMPLETE!", True, config.BLACK)
+        r = self._rects
+        self.draw_retro_box(screen, r['complete'], config.ORANGE, config.YELLOW, border_width=6)
+        title_text = f'{self._recipe_title} COMPLETE!'
+        title = self.title_font.render(title_text, True, config.WHITE)
+        shadow = self.title_font.render(title_text, True, config.BLACK)
         tr = title.get_rect(center=(config.SCREEN_WIDTH // 2, 270))
         screen.blit(shadow, tr.move(3, 3))
         screen.blit(title, tr)
 
-        total = max(1, len(self.recipe_questions))
+        total = max(1, self._num_questions)
         ratio = self.score / total
-        ssbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 250, 350, 500, 80)
+        ssbox = r['score_stat']
         fill = config.GREEN if ratio >= 0.9 else config.ORANGE if ratio >= 0.6 else config.RED
         self.draw_retro_box(screen, ssbox, fill, config.WHITE, border_width=4)
         st = self.font.render(f'Final Score: {self.score}/{total}', True, config.WHITE)
@@ -3092,9 +3272,9 @@ class SynonymAntonymState(State):
 
     def __init__(self, game):
         super().__init__(game)
-        self.font       = pygame.font.Font(config.FONT_PATH, 28)
-        self.title_font = pygame.font.Font(config.FONT_PATH, 42)
-        self.small_font = pygame.font.Font(config.FONT_PATH, 20)
+        self.font       = game.get_font(config.FONT_PATH, 28)
+        self.title_font = game.get_font(config.FONT_PATH, 42)
+        self.small_font = game.get_font(config.FONT_PATH, 20)
         self.language = None
         self.game_started = False
         self.current_question = 0
@@ -3103,14 +3283,15 @@ class SynonymAntonymState(State):
         self.show_result = False
         self.result_timer = 0
         self.questions = []
-        self.question_type = []
-        self.use_custom_questions = False
         self.active_difficulty_mode = 'General'
         self.game_finished = False
         self.score_submitted = False
         self.submit_message = ''
         self.round_start_time = 0
+        self._num_questions = 0
         self._cached_dimensions = None
+        self._rects = {}
+        self._titles = {}
 
     def enter(self):
         self.language = None
@@ -3120,13 +3301,12 @@ class SynonymAntonymState(State):
         self.selected_choice = None
         self.show_result = False
         self.questions = []
-        self.question_type = []
-        self.use_custom_questions = True
         self.active_difficulty_mode = 'General'
         self.game_finished = False
         self.score_submitted = False
         self.submit_message = ''
         self.round_start_time = time.time()
+        self._num_questions = 0
 
     def _load_questions(self):
         self.active_difficulty_mode = self.game.db.get_selected_difficulty_mode(
@@ -3155,16 +3335,9 @@ class SynonymAntonymState(State):
                 'correct_index': correct,
             })
 
-        if cooked:
-            random.shuffle(cooked)
-            self.questions = cooked
-            self.question_type = []
-            self.use_custom_questions = True
-            return
-
-        self.questions = []
-        self.question_type = []
-        self.use_custom_questions = True
+        random.shuffle(cooked)
+        self.questions = cooked
+        self._num_questions = len(cooked)
 
     def _submit_score(self):
         if self.score_submitted:
@@ -3192,11 +3365,6 @@ class SynonymAntonymState(State):
         except Exception as exc:
             self.submit_message = f'Could not save score: {exc}'
 
-    def _resolve(self, data_dict):
-        """get text in the right language"""
-        lang = self.language or 'english'
-        return data_dict.get(lang, data_dict['english'])
-
     def handle_event(self, event):
         if event.type != pygame.KEYDOWN:
             return
@@ -3213,35 +3381,21 @@ class SynonymAntonymState(State):
         elif self.game_finished:
             if event.key == pygame.K_RETURN:
                 self._submit_score()
-        elif not self.show_result and self.current_question < len(self.questions):
+        elif not self.show_result and self.current_question < self._num_questions:
             if event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
                 idx = event.key - pygame.K_1
-                if self.use_custom_questions:
-                    qd = self.questions[self.current_question]
-                    choices = qd['choices']
-                    if idx < len(choices):
-                        self.selected_choice = idx
-                        self.show_result = True
-                        self.result_timer = time.time()
-                        if idx == qd['correct_index']:
-                            self.score += 1
-                else:
-                    qd = self.questions[self.current_question]
-                    qt = self.question_type[self.current_question]
-                    correct = self._resolve(
-                        qd['synonym'] if qt == 'synonym' else qd['antonym'])
-                    choices = self._resolve(qd['choices'])
-                    if idx < len(choices):
-                        self.selected_choice = idx
-                        self.show_result = True
-                        self.result_timer = time.time()
-                        if choices[idx] == correct:
-                            self.score += 1
+                qd = self.questions[self.current_question]
+                if idx < len(qd['choices']):
+                    self.selected_choice = idx
+                    self.show_result = True
+                    self.result_timer = pygame.time.get_ticks()
+                    if idx == qd['correct_index']:
+                        self.score += 1
 
     def update(self, dt):
-        if self.show_result and time.time() - self.result_timer > 2:
+        if self.show_result and pygame.time.get_ticks() - self.result_timer > 2000:
             self.current_question += 1
-            if self.current_question >= len(self.questions):
+            if self.current_question >= self._num_questions:
                 self.game_finished = True
                 self.show_result = False
             else:
@@ -3258,6 +3412,8 @@ class SynonymAntonymState(State):
                 lambda i: (int(80 + i / h * 40),
                            max(0, int(80 + i / h * 40) - 30),
                            int(80 + i / h * 40) + 60))
+            self._rects = self._build_layout()
+            self._titles = self._build_titles()
             self._cached_dimensions = current_dims
         
         screen.blit(self._gradient_bg, (0, 0))
@@ -3278,14 +3434,38 @@ class SynonymAntonymState(State):
 
         if self.game_finished:
             self._draw_game_over(screen)
-        elif self.current_question < len(self.questions):
+        elif self.current_question < self._num_questions:
             self._draw_question(screen)
         else:
             self._draw_game_over(screen)
 
+    def _build_layout(self):
+        """the boxes that don't move, built once per screen size."""
+        w = config.SCREEN_WIDTH
+        return {
+            'no_questions': pygame.Rect(w // 2 - 360, 220, 720, 280),
+            'title': pygame.Rect(30, 30, w - 60, 70),
+            'progress': pygame.Rect(30, 120, 260, 45),
+            'score': pygame.Rect(w - 230, 120, 200, 45),
+            'context': pygame.Rect(100, 180, w - 200, 90),
+            'question': pygame.Rect(100, 290, w - 200, 75),
+            'game_over': pygame.Rect(w // 2 - 300, 200, 600, 350),
+            'score_stat': pygame.Rect(w // 2 - 250, 350, 500, 80),
+        }
+
+    def _build_titles(self):
+        """headings (and the game over drop shadow), rendered once per screen size."""
+        cx = config.SCREEN_WIDTH // 2
+        surf, (x, y) = self.render_centered(self.title_font, 'GAME COMPLETE!', config.YELLOW, (cx, 270))
+        shadow = self.title_font.render('GAME COMPLETE!', True, config.BLACK)
+        return {
+            'question': (self.render_centered(self.title_font, 'WORD MATCH GAME', config.WHITE,
+                                              self._rects['title'].center),),
+            'game_over': ((shadow, (x + 3, y + 3)), (surf, (x, y))),
+        }
+
     def _draw_no_questions(self, screen):
-        box = pygame.Rect(config.SCREEN_WIDTH // 2 - 360, 220, 720, 280)
-        self.draw_retro_box(screen, box, config.PURPLE, config.YELLOW,
+        self.draw_retro_box(screen, self._rects['no_questions'], config.PURPLE, config.YELLOW,
                             border_width=6)
         title = self.title_font.render('NO QUESTIONS FOUND', True, config.YELLOW)
         screen.blit(title, title.get_rect(center=(config.SCREEN_WIDTH // 2, 280)))
@@ -3302,149 +3482,54 @@ class SynonymAntonymState(State):
         screen.blit(line3, line3.get_rect(center=(config.SCREEN_WIDTH // 2, 432)))
 
     def _draw_question(self, screen):
-        if self.use_custom_questions:
-            qd = self.questions[self.current_question]
-
-            # Title
-            tbox = pygame.Rect(30, 30, config.SCREEN_WIDTH - 60, 70)
-            self.draw_retro_box(screen, tbox, config.PURPLE, config.YELLOW,
-                                border_width=5)
-            t = self.title_font.render('WORD MATCH GAME', True, config.WHITE)
-            screen.blit(t, t.get_rect(center=tbox.center))
-
-            # Progress
-            pbox = pygame.Rect(30, 120, 260, 45)
-            self.draw_retro_box(screen, pbox, config.DARK_GRAY, config.WHITE)
-            screen.blit(self.small_font.render(
-                f'Question {self.current_question + 1}/{len(self.questions)}', True, config.WHITE),
-                (40, 132))
-
-            # Score
-            sbox = pygame.Rect(config.SCREEN_WIDTH - 230, 120, 200, 45)
-            self.draw_retro_box(screen, sbox, config.DARK_GRAY, config.WHITE)
-            screen.blit(self.small_font.render(f'Score: {self.score}', True,
-                                               config.YELLOW),
-                        (config.SCREEN_WIDTH - 210, 132))
-
-            # Prompt/context
-            cbox = pygame.Rect(100, 180, config.SCREEN_WIDTH - 200, 90)
-            self.draw_retro_box(screen, cbox, config.LIGHT_BLUE, config.PURPLE)
-            cl = self.wrap_text_pixel(qd['prompt'], config.SCREEN_WIDTH - 240,
-                                      self.small_font)
-            cy = 193
-            for line in cl[:3]:
-                screen.blit(self.small_font.render(line, True, config.BLACK),
-                            (120, cy))
-                cy += 22
-
-            # Question text
-            qbox = pygame.Rect(100, 290, config.SCREEN_WIDTH - 200, 75)
-            self.draw_retro_box(screen, qbox, config.WHITE, config.PURPLE,
-                                border_width=5)
-            q_lines = self.wrap_text_pixel(qd['question'], config.SCREEN_WIDTH - 250,
-                                           self.small_font)
-            qy = 305
-            for line in q_lines[:2]:
-                screen.blit(self.small_font.render(line, True, config.BLACK),
-                            (120, qy))
-                qy += 24
-
-            # Choices
-            y = 385
-            for i, choice in enumerate(qd['choices']):
-                chbox = pygame.Rect(100, y, config.SCREEN_WIDTH - 200, 60)
-                if self.show_result:
-                    if i == qd['correct_index']:
-                        bg, brd, tc = config.GREEN, config.WHITE, config.WHITE
-                    elif i == self.selected_choice:
-                        bg, brd, tc = config.RED, config.YELLOW, config.WHITE
-                    else:
-                        bg, brd, tc = config.DARK_GRAY, config.LIGHT_GRAY, config.LIGHT_GRAY
-                else:
-                    bg, brd, tc = config.PURPLE, config.YELLOW, config.WHITE
-
-                self.draw_retro_box(screen, chbox, bg, brd, border_width=4)
-
-                bs = 35
-                br = pygame.Rect(115, y + 12, bs, bs)
-                self.draw_retro_box(screen, br, config.YELLOW, config.BLACK,
-                                    shadow=False, border_width=2)
-                nt = self.font.render(str(i + 1), True, config.BLACK)
-                screen.blit(nt, nt.get_rect(center=br.center))
-
-                ct = self.font.render(choice, True, tc)
-                screen.blit(ct, ct.get_rect(left=165, centery=y + 30))
-                y += 75
-
-            if self.show_result:
-                rbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 150, y + 10, 300, 50)
-                correct = self.selected_choice == qd['correct_index']
-                self.draw_retro_box(screen, rbox,
-                                    config.GREEN if correct else config.RED,
-                                    config.WHITE, border_width=4)
-                msg = '✓ CORRECT!' if correct else '✗ WRONG!'
-                rt = self.font.render(msg, True, config.WHITE)
-                screen.blit(rt, rt.get_rect(center=rbox.center))
-            return
-
         qd = self.questions[self.current_question]
-        qt = self.question_type[self.current_question]
-        q = {
-            'context': self._resolve(qd['context']),
-            'word':    self._resolve(qd['word']),
-            'synonym': self._resolve(qd['synonym']),
-            'antonym': self._resolve(qd['antonym']),
-            'choices': self._resolve(qd['choices']),
-        }
+        r = self._rects
 
         # Title
-        tbox = pygame.Rect(30, 30, config.SCREEN_WIDTH - 60, 70)
-        self.draw_retro_box(screen, tbox, config.PURPLE, config.YELLOW,
+        self.draw_retro_box(screen, r['title'], config.PURPLE, config.YELLOW,
                             border_width=5)
-        t = self.title_font.render('WORD MATCH GAME', True, config.WHITE)
-        screen.blit(t, t.get_rect(center=tbox.center))
+        for surf, pos in self._titles['question']:
+            screen.blit(surf, pos)
 
         # Progress
-        pbox = pygame.Rect(30, 120, 200, 45)
-        self.draw_retro_box(screen, pbox, config.DARK_GRAY, config.WHITE)
+        self.draw_retro_box(screen, r['progress'], config.DARK_GRAY, config.WHITE)
         screen.blit(self.small_font.render(
-            f'Question {self.current_question + 1}/{len(self.questions)}', True, config.WHITE),
+            f'Question {self.current_question + 1}/{self._num_questions}', True, config.WHITE),
             (40, 132))
 
         # Score
-        sbox = pygame.Rect(config.SCREEN_WIDTH - 230, 120, 200, 45)
-        self.draw_retro_box(screen, sbox, config.DARK_GRAY, config.WHITE)
+        self.draw_retro_box(screen, r['score'], config.DARK_GRAY, config.WHITE)
         screen.blit(self.small_font.render(f'Score: {self.score}', True,
                                            config.YELLOW),
                     (config.SCREEN_WIDTH - 210, 132))
 
-        # Context
-        cbox = pygame.Rect(100, 180, config.SCREEN_WIDTH - 200, 80)
-        self.draw_retro_box(screen, cbox, config.LIGHT_BLUE, config.PURPLE)
-        cl = self.wrap_text_pixel(q['context'], config.SCREEN_WIDTH - 240,
+        # Prompt/context
+        self.draw_retro_box(screen, r['context'], config.LIGHT_BLUE, config.PURPLE)
+        cl = self.wrap_text_pixel(qd['prompt'], config.SCREEN_WIDTH - 240,
                                   self.small_font)
-        cy = 190
-        for line in cl:
+        cy = 193
+        for line in cl[:3]:
             screen.blit(self.small_font.render(line, True, config.BLACK),
                         (120, cy))
-            cy += 20
+            cy += 22
 
-        # Word
-        wbox = pygame.Rect(100, 280, config.SCREEN_WIDTH - 200, 60)
-        self.draw_retro_box(screen, wbox, config.WHITE, config.PURPLE,
+        # Question text
+        self.draw_retro_box(screen, r['question'], config.WHITE, config.PURPLE,
                             border_width=5)
-        wt = self.title_font.render(q['word'].upper(), True, config.PURPLE)
-        screen.blit(wt, wt.get_rect(center=(config.SCREEN_WIDTH // 2, 310)))
-        pr = self.font.render(f"Select the {qt.upper()}", True, config.BLACK)
-        screen.blit(pr, pr.get_rect(center=(config.SCREEN_WIDTH // 2, 335)))
+        q_lines = self.wrap_text_pixel(qd['question'], config.SCREEN_WIDTH - 250,
+                                       self.small_font)
+        qy = 305
+        for line in q_lines[:2]:
+            screen.blit(self.small_font.render(line, True, config.BLACK),
+                        (120, qy))
+            qy += 24
 
         # Choices
-        correct_ans = q['synonym'] if qt == 'synonym' else q['antonym']
-        y = 350
-        for i, choice in enumerate(q['choices']):
+        y = 385
+        for i, choice in enumerate(qd['choices']):
             chbox = pygame.Rect(100, y, config.SCREEN_WIDTH - 200, 60)
             if self.show_result:
-                if choice == correct_ans:
+                if i == qd['correct_index']:
                     bg, brd, tc = config.GREEN, config.WHITE, config.WHITE
                 elif i == self.selected_choice:
                     bg, brd, tc = config.RED, config.YELLOW, config.WHITE
@@ -3468,8 +3553,7 @@ class SynonymAntonymState(State):
 
         if self.show_result:
             rbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 150, y + 10, 300, 50)
-            sel = q['choices'][self.selected_choice]
-            correct = (sel == correct_ans)
+            correct = self.selected_choice == qd['correct_index']
             self.draw_retro_box(screen, rbox,
                                 config.GREEN if correct else config.RED,
                                 config.WHITE, border_width=4)
@@ -3478,19 +3562,17 @@ class SynonymAntonymState(State):
             screen.blit(rt, rt.get_rect(center=rbox.center))
 
     def _draw_game_over(self, screen):
-        gobox = pygame.Rect(config.SCREEN_WIDTH // 2 - 300, 200, 600, 350)
-        self.draw_retro_box(screen, gobox, config.PURPLE, config.YELLOW,
+        r = self._rects
+        self.draw_retro_box(screen, r['game_over'], config.PURPLE, config.YELLOW,
                             border_width=6)
 
-        t = self.title_font.render('GAME COMPLETE!', True, config.YELLOW)
-        ts = self.title_font.render('GAME COMPLETE!', True, config.BLACK)
-        tr = t.get_rect(center=(config.SCREEN_WIDTH // 2, 270))
-        screen.blit(ts, tr.move(3, 3)); screen.blit(t, tr)
+        for surf, pos in self._titles['game_over']:
+            screen.blit(surf, pos)
 
-        total = max(1, len(self.questions))
+        total = max(1, self._num_questions)
         ratio = self.score / total
 
-        ssbox = pygame.Rect(config.SCREEN_WIDTH // 2 - 250, 350, 500, 80)
+        ssbox = r['score_stat']
         sc = (config.GREEN if ratio >= 0.8
               else config.ORANGE if ratio >= 0.55
               else config.RED)
@@ -0,0 +1,25 @@
+# text cache file
+# rendered text shared by the map labels and every state
+
+import pygame
+
+# keyed by the font object itself, fonts live for the whole run anyway.
+# states.py sizes its wrap cache off the same limit. caches just get
+# cleared when they fill up, no lru bookkeeping.
+TEXT_CACHE_LIMIT = 4096
+_TEXT_CACHE = {}
+
+
+def render_cached(font, text, color):
+    """font.render(text, True, color) but only rasterized once per
+    (font, text, color). dont mutate the returned surface, its shared."""
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= TEXT_CACHE_LIMIT:
+            _TEXT_CACHE.clear()
+        surf = font.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        _TEXT_CACHE[key] = surf
+    return surf
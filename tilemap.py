@@ -3,9 +3,11 @@
 
 import pygame
 import os
-import csv
 import random
+from array import array
+from collections import OrderedDict
 import config
+from textcache import render_cached
 
 # dev footnotes / map layer lore:
 # - csv layers come from tiled export, names must match exactly.
@@ -14,6 +16,21 @@ import config
 # - interaction zones are discovered from *_gamedesignation layers.
 # - if map draws black/missing, check tileset path first before anything else.
 
+# tiled flip flags, stored in the high bits of each tile id
+FLIPPED_HORIZONTALLY_FLAG = 0x80000000
+FLIPPED_VERTICALLY_FLAG = 0x40000000
+FLIPPED_DIAGONALLY_FLAG = 0x20000000
+FLAGS_MASK = ~(FLIPPED_HORIZONTALLY_FLAG | FLIPPED_VERTICALLY_FLAG | FLIPPED_DIAGONALLY_FLAG)
+
+# player facing directions, in the order the flat frame lists use,
+# and which row of the lpc sprite sheets holds each one
+DIR_ORDER = ('down', 'up', 'right', 'left')
+SHEET_ROWS = (2, 0, 3, 1)
+
+# sliced player frames per (sheet filename, size). the menu makes a new
+# Player every time its entered, this keeps that from re-reading the pngs.
+_SHEET_CACHE = {}
+
 class Tilemap:
     """tilemap loader + renderer + map interactions.
 
@@ -25,7 +42,7 @@ class Tilemap:
     def __init__(self):
         self.tile_size = 32  # tile size on map
         self.tileset_tile_size = 16  # tile size in the tileset image
-        self.tile_cache = {}  # save tiles so we dont re-render them each frame
+        self.tile_cache = {}  # raw tile id -> ready to blit surface, see build_tile_cache
         
         # load the tileset image
         tileset_path = f'{config.IMAGE_PATH}/Sunnyside_World_ASSET_PACK_V2.1/Sunnyside_World_Assets/Tileset/spr_tileset_sunnysideworld_16px.png'
@@ -72,7 +89,7 @@ class Tilemap:
         
         # get map size from first layer
         if self.layers:
-            first_layer = list(self.layers.values())[0]
+            first_layer = next(iter(self.layers.values()))
             self.map_width = len(first_layer[0]) * self.tile_size
             self.map_height = len(first_layer) * self.tile_size
         else:
@@ -82,6 +99,39 @@ class Tilemap:
         # set up collision
         if 'collision' in self.layers:
             self.collision_map = self.layers['collision']
+
+        # every tile the map uses, ready to blit
+        self.build_tile_cache()
+
+        # baked map sections, filled in lazily by draw_sections.
+        # back = everything under the player, front = drawn over the player
+        self.layer_groups = {
+            'back': [name for name in self.layer_order
+                     if name not in self.FRONT_LAYERS and name in self.layers],
+            'front': [name for name in self.layer_order
+                      if name in self.FRONT_LAYERS and name in self.layers],
+        }
+        # kept in lru order and capped in draw_sections, so walking the
+        # whole map doesnt leave every 512px section alive for the session
+        self.sections = {'back': OrderedDict(), 'front': OrderedDict()}
+        self.sections_x = -(-self.map_width // self.SECTION_SIZE)
+        self.sections_y = -(-self.map_height // self.SECTION_SIZE)
+        self.build_section_tiles()
+
+        # collision rows as bitmasks (bit x set = tile x blocked), one int
+        # per row instead of a 4 byte cell per tile
+        self.collision_bits = [
+            sum(1 << x for x, tile_id in enumerate(row) if tile_id > 0)
+            for row in self.collision_map
+        ]
+
+        # tile bounds for is_collision, anything at or past these is blocked
+        if self.collision_map:
+            self.max_tile_x = len(self.collision_map[0])
+            self.max_tile_y = len(self.collision_map)
+        else:
+            self.max_tile_x = (self.map_width - 32) // self.tile_size
+            self.max_tile_y = (self.map_height - 32) // self.tile_size
         
         # find where the games are on the map
         self.interaction_zones = {}
@@ -95,25 +145,34 @@ class Tilemap:
         
         # update labels to match
         self.update_labels()
+
+        # tile -> zone lookup for check_interaction
+        self.build_zone_grid()
     
     def load_csv_layer(self, csv_path):
-        """load a csv layer into a 2d list
-        
+        """load a csv layer into a list of rows
+
         tiled uses -1 for empty tiles and big numbers for flipped tiles
-        convert to unsigned 32-bit so the flip flags work
+        convert to unsigned 32-bit so the flip flags work.
+        each row is a packed array('I') (4 bytes a cell) instead of a list
+        of python ints, indexing works the same.
+        tiled csvs are plain numbers (no quoting) so the file is just split
+        on lines and commas, quicker than going through csv.reader.
         """
         layer = []
         with open(csv_path, 'r') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                parsed = []
-                for cell in row:
-                    cell = cell.strip()
-                    if not cell or cell == '-1':
-                        parsed.append(0)           # empty tile
-                    else:
-                        parsed.append(int(cell) & 0xFFFFFFFF)  # fixes negative numbers somehow
-                layer.append(parsed)
+            lines = f.read().splitlines()
+        for line in lines:
+            if not line:
+                continue  # blank line, usually the end of the file
+            parsed = []
+            for cell in line.split(','):
+                cell = cell.strip()
+                if not cell or cell == '-1':
+                    parsed.append(0)           # empty tile
+                else:
+                    parsed.append(int(cell) & 0xFFFFFFFF)  # fixes negative numbers somehow
+            layer.append(array('I', parsed))
         return layer
     
     def process_gamedesignation(self):
@@ -128,17 +187,17 @@ class Tilemap:
         for layer_name, zone_name in layer_to_zone.items():
             if layer_name not in self.layers:
                 continue
-            layer = self.layers[layer_name]
-            for y, row in enumerate(layer):
-                for x, tile_id in enumerate(row):
-                    if tile_id > 0 and zone_name not in self.interaction_zones:
-                        self.interaction_zones[zone_name] = {
-                            'x': x * self.tile_size,
-                            'y': y * self.tile_size,
-                            'width': self.tile_size,
-                            'height': self.tile_size
-                        }
-                        print(f"Found interaction zone '{zone_name}' at tile ({x}, {y})")
+            # only the first tile of each layer matters
+            found = self._first_tile(self.layers[layer_name])
+            if found and zone_name not in self.interaction_zones:
+                x, y = found
+                self.interaction_zones[zone_name] = {
+                    'x': x * self.tile_size,
+                    'y': y * self.tile_size,
+                    'width': self.tile_size,
+                    'height': self.tile_size
+                }
+                print(f"Found interaction zone '{zone_name}' at tile ({x}, {y})")
     
     def get_valid_land_tiles(self):
         """get all tiles the player can walk on"""
@@ -212,6 +271,25 @@ class Tilemap:
         else:
             print("Warning: Could not find suitable positions for games")
     
+    def build_zone_grid(self):
+        """map every tile next to (or on) a zone origin to that zone's name.
+
+        zones never move after setup so check_interaction can just do one
+        dict lookup instead of scanning the 3x3 area against every zone.
+        keeps the old scan order when zones are close: the neighbour
+        checked first (top-left to bottom-right) wins.
+        """
+        self.zone_grid = {}
+        ranks = {}
+        for zone_name, zone in self.interaction_zones.items():
+            zone_tx = zone['x'] // self.tile_size
+            zone_ty = zone['y'] // self.tile_size
+            for rank, (dy, dx) in enumerate((dy, dx) for dy in range(-1, 2) for dx in range(-1, 2)):
+                key = (zone_tx - dx, zone_ty - dy)
+                if key not in ranks or rank < ranks[key]:
+                    ranks[key] = rank
+                    self.zone_grid[key] = zone_name
+
     def update_labels(self):
         """update the label positions to match the zones"""
         self.labels = []
@@ -236,25 +314,25 @@ class Tilemap:
         """find where the player starts - looks at spawnpoint layer first"""
         # first try the spawnpoint csv
         if 'spawnpoint' in self.layers:
-            for y, row in enumerate(self.layers['spawnpoint']):
-                for x, tile_id in enumerate(row):
-                    if tile_id > 0:
-                        print(f"Found spawn on spawnpoint layer at ({x}, {y})")
-                        return x, y
+            found = self._first_tile(self.layers['spawnpoint'])
+            if found:
+                x, y = found
+                print(f"Found spawn on spawnpoint layer at ({x}, {y})")
+                return x, y
         
         # use ground layer if no spawnpoint
         for layer_name in ['ground', 'water']:
             if layer_name in self.layers:
                 layer = self.layers[layer_name]
-                for y, row in enumerate(layer):
-                    for x, tile_id in enumerate(row):
-                        if tile_id > 0:
-                            print(f"Found spawn on {layer_name} at ({x}, {y}), ID: {tile_id}")
-                            return x, y
+                found = self._first_tile(layer)
+                if found:
+                    x, y = found
+                    print(f"Found spawn on {layer_name} at ({x}, {y}), ID: {layer[y][x]}")
+                    return x, y
         
         # just use the middle of the map
         if self.layers:
-            first_layer = list(self.layers.values())[0]
+            first_layer = next(iter(self.layers.values()))
             center_x = len(first_layer[0]) // 2
             center_y = len(first_layer) // 2
             print(f"Using map center: ({center_x}, {center_y})")
@@ -263,160 +341,228 @@ class Tilemap:
         print("No suitable spawn found, using default (10, 8)")
         return 10, 8
     
+    @staticmethod
+    def _first_tile(layer):
+        """(x, y) of the first non-empty tile, going row by row, or None.
+        empty rows get skipped with one any() call instead of a python loop"""
+        for y, row in enumerate(layer):
+            if any(row):
+                for x, tile_id in enumerate(row):
+                    if tile_id > 0:
+                        return x, y
+        return None
+
     # layers drawn on top of the player
     FRONT_LAYERS = {'object_front_low', 'object_front_high', 'shadow'}
+    SECTION_SIZE = 512  # baked map chunk size in pixels
+    SECTION_CACHE_SCREENS = 2  # keep this many screens worth of sections baked
+    BACKGROUND = (135, 206, 235)  # sky color behind the map
 
     def draw(self, screen, camera_x, camera_y):
         """draw the map with camera offset"""
-        camera_x = int(camera_x)
-        camera_y = int(camera_y)
-        
-        if not self.tileset:
-            return
-        
-        # draw each layer from bottom to top
-        for layer_name in self.layer_order:
-            if layer_name in self.layers:
-                self.draw_layer(screen, self.layers[layer_name], camera_x, camera_y)
+        # front layers are the last ones in layer_order so this keeps the order
+        self.draw_back(screen, camera_x, camera_y)
+        self.draw_front(screen, camera_x, camera_y)
 
     def draw_back(self, screen, camera_x, camera_y):
         """draw layers that go behind the player"""
-        camera_x = int(camera_x)
-        camera_y = int(camera_y)
-        if not self.tileset:
-            return
-        for layer_name in self.layer_order:
-            if layer_name not in self.FRONT_LAYERS and layer_name in self.layers:
-                self.draw_layer(screen, self.layers[layer_name], camera_x, camera_y)
+        self.draw_sections(screen, 'back', camera_x, camera_y)
 
     def draw_front(self, screen, camera_x, camera_y):
         """draw layers that go in front of the player"""
+        self.draw_sections(screen, 'front', camera_x, camera_y)
+
+    def draw_sections(self, screen, group, camera_x, camera_y):
+        """blit the baked sections of a layer group that overlap the screen.
+
+        the map never changes, so instead of blitting every visible tile of
+        every layer each frame the layers get baked into SECTION_SIZE squares
+        the first time theyre on screen and reused after that. only the most
+        recently drawn SECTION_CACHE_SCREENS screens worth stay baked, the
+        rest get dropped and rebaked (couple ms) if the player walks back.
+        """
         camera_x = int(camera_x)
         camera_y = int(camera_y)
         if not self.tileset:
             return
-        for layer_name in self.layer_order:
-            if layer_name in self.FRONT_LAYERS and layer_name in self.layers:
-                self.draw_layer(screen, self.layers[layer_name], camera_x, camera_y)
-    
-    def draw_layer(self, screen, layer_data, camera_x, camera_y):
-        """draw one layer"""
-        # these flags tell us if tiles are flipped
-        FLIPPED_HORIZONTALLY_FLAG = 0x80000000
-        FLIPPED_VERTICALLY_FLAG = 0x40000000
-        FLIPPED_DIAGONALLY_FLAG = 0x20000000
-        FLAGS_MASK = ~(FLIPPED_HORIZONTALLY_FLAG | FLIPPED_VERTICALLY_FLAG | FLIPPED_DIAGONALLY_FLAG)
-        
-        # only draw tiles that are on screen (faster)
-        start_x = max(0, camera_x // self.tile_size - 1)
-        start_y = max(0, camera_y // self.tile_size - 1)
-        end_x = min(len(layer_data[0]), (camera_x + config.SCREEN_WIDTH) // self.tile_size + 2)
-        end_y = min(len(layer_data), (camera_y + config.SCREEN_HEIGHT) // self.tile_size + 2)
-        
-        for y in range(start_y, end_y):
-            row = layer_data[y]
-            for x in range(start_x, end_x):
-                tile_id = row[x]
-                if tile_id != 0:  # skip empty tiles
-                    # cache key includes flip info
-                    cache_key = tile_id
-                    
-                    # check if we already made this tile
-                    if cache_key not in self.tile_cache:
-                        # check which flips are applied
-                        flipped_h = tile_id & FLIPPED_HORIZONTALLY_FLAG
-                        flipped_v = tile_id & FLIPPED_VERTICALLY_FLAG
-                        flipped_d = tile_id & FLIPPED_DIAGONALLY_FLAG
-                        
-                        # get the actual tile id without flags
-                        clean_tile_id = tile_id & FLAGS_MASK
-                        
-                        # tileset starts at 0
-                        idx = clean_tile_id
-                        if idx < 0:
-                            self.tile_cache[cache_key] = None
-                            continue
-                        
-                        # get position in the tileset image
-                        tile_x = (idx % self.tileset_width) * self.tileset_tile_size
-                        tile_y = (idx // self.tileset_width) * self.tileset_tile_size
-                        
-                        # skip if out of bounds
-                        if tile_x + self.tileset_tile_size > self.tileset.get_width() or tile_y + self.tileset_tile_size > self.tileset.get_height():
-                            self.tile_cache[cache_key] = None
+
+        size = self.SECTION_SIZE
+        sections = self.sections[group]
+        screen_w, screen_h = screen.get_size()
+        start_x = max(0, camera_x // size)
+        start_y = max(0, camera_y // size)
+        end_x = min(self.sections_x, (camera_x + screen_w - 1) // size + 1)
+        end_y = min(self.sections_y, (camera_y + screen_h - 1) // size + 1)
+
+        for sy in range(start_y, end_y):
+            for sx in range(start_x, end_x):
+                key = (sx, sy)
+                if key in sections:
+                    sections.move_to_end(key)
+                    section = sections[key]
+                else:
+                    section = self.bake_section(group, sx, sy)
+                    sections[key] = section
+                    # cap is a few screens, so nothing visible gets evicted
+                    limit = (self.SECTION_CACHE_SCREENS
+                             * (-(-screen_w // size) + 1) * (-(-screen_h // size) + 1))
+                    while len(sections) > limit:
+                        sections.popitem(last=False)
+                if section is not None:  # None = nothing drawn there
+                    screen.blit(section, (sx * size - camera_x, sy * size - camera_y))
+
+    def bake_section(self, group, sx, sy):
+        """draw one section of a layer group onto its own surface.
+
+        the back group sits on the sky color so it comes out opaque (plain
+        copy blits, same pixels as drawing the tiles straight to the screen).
+        the front group keeps alpha and returns None if nothing is in it.
+        """
+        size = self.SECTION_SIZE
+        if group == 'back':
+            section = pygame.Surface((size, size))
+            section.fill(self.BACKGROUND)
+        else:
+            section = pygame.Surface((size, size), pygame.SRCALPHA)
+        tiles = self.section_tiles[group].get((sx, sy))
+        if tiles:
+            section.blits(tiles, doreturn=False)
+        if group == 'back':
+            return section.convert()
+        if section.get_bounding_rect().width == 0:
+            return None
+        return section.convert_alpha()
+
+    def build_section_tiles(self):
+        """bucket the non-empty tiles of each layer group by map section.
+
+        each bucket is a ready (surface, pos) list in layer order, so baking
+        a section only touches its own tiles instead of scanning the grid.
+        SECTION_SIZE is a multiple of tile_size so a tile never straddles two.
+        """
+        per_section = self.SECTION_SIZE // self.tile_size
+        self.section_tiles = {}
+        for group, layer_names in self.layer_groups.items():
+            buckets = {}
+            for layer_name in layer_names:
+                for y, row in enumerate(self.layers[layer_name]):
+                    if not any(row):
+                        continue  # most rows of the decoration layers are empty
+                    sy, local_y = divmod(y, per_section)
+                    for x, tile_id in enumerate(row):
+                        if tile_id == 0:
                             continue
-                        
-                        # cut out the tile from the tileset
-                        try:
-                            tile_surf = self.tileset.subsurface((tile_x, tile_y, self.tileset_tile_size, self.tileset_tile_size)).copy()
-                        except (ValueError, pygame.error):
-                            self.tile_cache[cache_key] = None
+                        tile_surf = self.tile_cache.get(tile_id)
+                        if tile_surf is None:
                             continue
-                        
-                        # flip it if needed
-                        if flipped_h:
-                            tile_surf = pygame.transform.flip(tile_surf, True, False)
-                        if flipped_v:
-                            tile_surf = pygame.transform.flip(tile_surf, False, True)
-                        if flipped_d:
-                            tile_surf = pygame.transform.rotate(tile_surf, -90)
-                            tile_surf = pygame.transform.flip(tile_surf, True, False)
-                        
-                        # scale up and save to cache
-                        tile_surf = pygame.transform.scale(tile_surf, (self.tile_size, self.tile_size))
-                        self.tile_cache[cache_key] = tile_surf
-                    
-                    # draw the tile (skip if None)
-                    if self.tile_cache[cache_key] is not None:
-                        screen_x = int(x * self.tile_size - camera_x)
-                        screen_y = int(y * self.tile_size - camera_y)
-                        screen.blit(self.tile_cache[cache_key], (screen_x, screen_y))
-    
+                        sx, local_x = divmod(x, per_section)
+                        buckets.setdefault((sx, sy), []).append(
+                            (tile_surf, (local_x * self.tile_size, local_y * self.tile_size)))
+            self.section_tiles[group] = buckets
+
+    def build_tile_cache(self):
+        """cut, flip and scale every tile id the visual layers use, once.
+
+        build_section_tiles then resolves every map cell to its surface
+        with one dict lookup, frames only ever blit the baked sections.
+        """
+        self.tile_cache = {}
+        if not self.tileset:
+            return
+        used_ids = set()
+        for layer_name in self.layer_order:
+            if layer_name in self.layers:
+                for row in self.layers[layer_name]:
+                    used_ids.update(row)
+        used_ids.discard(0)
+        for tile_id in used_ids:
+            self.tile_cache[tile_id] = self._make_tile(tile_id)
+
+    def _make_tile(self, tile_id):
+        """build the 32x32 surface for a raw tile id (flip flags included).
+        returns None if the id doesnt point at a real tile."""
+        # check which flips are applied
+        flipped_h = tile_id & FLIPPED_HORIZONTALLY_FLAG
+        flipped_v = tile_id & FLIPPED_VERTICALLY_FLAG
+        flipped_d = tile_id & FLIPPED_DIAGONALLY_FLAG
+
+        # get the actual tile id without flags (tileset starts at 0)
+        idx = tile_id & FLAGS_MASK
+        if idx < 0:
+            return None
+
+        # get position in the tileset image (one divmod, this only runs
+        # once per unique id so a lookup table wouldnt buy anything)
+        tile_row, tile_col = divmod(idx, self.tileset_width)
+        tile_x = tile_col * self.tileset_tile_size
+        tile_y = tile_row * self.tileset_tile_size
+
+        # skip if out of bounds
+        if tile_x + self.tileset_tile_size > self.tileset.get_width() or tile_y + self.tileset_tile_size > self.tileset.get_height():
+            return None
+
+        # cut out the tile from the tileset. bounds are checked above so
+        # just blit the area into a fresh surface (no subsurface + copy)
+        tile_surf = pygame.Surface((self.tileset_tile_size, self.tileset_tile_size), pygame.SRCALPHA)
+        tile_surf.blit(self.tileset, (0, 0),
+                       (tile_x, tile_y, self.tileset_tile_size, self.tileset_tile_size))
+
+        # flip it if needed
+        if flipped_h:
+            tile_surf = pygame.transform.flip(tile_surf, True, False)
+        if flipped_v:
+            tile_surf = pygame.transform.flip(tile_surf, False, True)
+        if flipped_d:
+            tile_surf = pygame.transform.rotate(tile_surf, -90)
+            tile_surf = pygame.transform.flip(tile_surf, True, False)
+
+        # scale up
+        tile_surf = pygame.transform.scale(tile_surf, (self.tile_size, self.tile_size))
+        # fully opaque tiles dont need per pixel alpha, plain
+        # display format lets them blit as a straight copy
+        if pygame.mask.from_surface(tile_surf, 254).count() == self.tile_size * self.tile_size:
+            return tile_surf.convert()
+        return tile_surf.convert_alpha()
+
     def is_collision(self, tile_x, tile_y):
         """check if the tile is blocked"""
-        # check if out of bounds
-        if tile_x < 0 or tile_y < 0:
-            return True
-        if tile_x >= len(self.collision_map[0]) if self.collision_map else tile_x * 32 >= self.map_width - 32:
+        # out of bounds counts as blocked
+        if (tile_x < 0 or tile_y < 0
+                or tile_x >= self.max_tile_x or tile_y >= self.max_tile_y):
             return True
-        if tile_y >= len(self.collision_map) if self.collision_map else tile_y * 32 >= self.map_height - 32:
-            return True
-        
-        # check the collision layer
-        if self.collision_map and 0 <= tile_y < len(self.collision_map) and 0 <= tile_x < len(self.collision_map[tile_y]):
-            return self.collision_map[tile_y][tile_x] > 0
-        
+
+        # check the collision layer (short rows just have no bits past the end)
+        if self.collision_bits:
+            return (self.collision_bits[tile_y] >> tile_x) & 1 == 1
+
         return False
     
     def check_interaction(self, tile_x, tile_y):
-        """check if player is near a game zone"""
-        # check the player tile and tiles around it
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                check_x = tile_x + dx
-                check_y = tile_y + dy
-                pixel_x = check_x * self.tile_size
-                pixel_y = check_y * self.tile_size
-                
-                for zone_name, zone in self.interaction_zones.items():
-                    if (zone['x'] == pixel_x and zone['y'] == pixel_y):
-                        return zone_name
-        
-        return None
+        """check if player is near a game zone (on it or any tile around it)"""
+        return self.zone_grid.get((tile_x, tile_y))
     
     def draw_labels(self, screen, camera_x, camera_y, font):
         """draw the labels above each game zone"""
+        screen_w, screen_h = screen.get_size()
+        blit_seq = []
         for label in self.labels:
             x = label['x'] - camera_x
             y = label['y'] - camera_y
-            
-            text = font.render(label['text'], True, config.WHITE)
-            text_shadow = font.render(label['text'], True, config.BLACK)
-            
-            # shadow
-            screen.blit(text_shadow, (x + 2, y + 2))
-            # draw it
-            screen.blit(text, (x, y))
+
+            text = render_cached(font, label['text'], config.WHITE)
+            text_shadow = render_cached(font, label['text'], config.BLACK)
+
+            # skip labels that are fully off screen (shadow is 2px further)
+            if (x + text.get_width() + 2 < 0 or y + text.get_height() + 2 < 0
+                    or x >= screen_w or y >= screen_h):
+                continue
+
+            # shadow first, then the text on top
+            blit_seq.append((text_shadow, (x + 2, y + 2)))
+            blit_seq.append((text, (x, y)))
+
+        if blit_seq:
+            screen.blits(blit_seq, doreturn=False)
 
 
 class Player:
@@ -425,7 +571,12 @@ class Player:
     quick notes:
     - movement is tile target based, but pixel lerp keeps it looking smooth.
     - supports walk/run sprite strips with fallback box character.
+    - frames live in one flat list per sheet, index = frame_base + frame
+      (frame_base = dir_index * 8, kept in sync by move).
     """
+    FRAMES_PER_DIR = 8
+    DIR_INDEX = {direction: i for i, direction in enumerate(DIR_ORDER)}
+
     def __init__(self, start_x, start_y):
         self.tile_x = start_x
         self.tile_y = start_y
@@ -435,9 +586,14 @@ class Player:
         self.animation_frame = 0
         self.idle_animation_frame = 0
         self.direction = 'down'
+        self.dir_index = self.DIR_INDEX['down']
+        self.frame_base = self.dir_index * self.FRAMES_PER_DIR
         self.moving = False
         self.running = False
         self.size = 100  # how big the character looks
+        # sprite offset from the tile: centered sideways, feet on the tile
+        self.draw_off_x = (self.size - 32) // 2
+        self.draw_off_y = self.size - 32
 
         # grid movement vars
         self.target_tile_x = start_x
@@ -447,59 +603,48 @@ class Player:
         
         # load the sprites
         self.load_sprite()
-    
-    def load_strip(self, filename, direction, num_frames=8):
-        """load animation frames for one direction from a sprite sheet"""
-        path = f'{config.IMAGE_PATH}/lpc_male_animations_2026-02-05T00-35-56/standard/{filename}'
-        if os.path.exists(path):
-            grid = pygame.image.load(path).convert_alpha()
-            frame_width = 64
-            frame_height = 64
-            row_index = {'down': 2, 'up': 0, 'right': 3, 'left': 1}[direction]
-            frames = []
-            for i in range(num_frames):
-                x = i * frame_width
-                y = row_index * frame_height
-                frame = grid.subsurface((x, y, frame_width, frame_height)).copy()
-                frame = pygame.transform.scale(frame, (self.size, self.size))
-                frames.append(frame)
-            return frames
-        else:
-            return None
+        self.fallback_poses = None  # box person frames, made on first use
     
     def load_sprite(self):
         """load all the animation frames"""
-        self.sprite_frames = {}
-        self.sprite_frames_run = {}
-        self.sprite_frames_idle = {}
-        
-        # walk animations
-        for direction in ['down', 'up', 'right', 'left']:
-            frames = self.load_strip('walk.png', direction, 8)
-            if frames:
-                self.sprite_frames[direction] = frames
-        
-        if not self.sprite_frames:
-            self.sprite_frames = None
-        
-        # run animations
-        for direction in ['down', 'up', 'right', 'left']:
-            frames = self.load_strip('run.png', direction, 8)
-            if frames:
-                self.sprite_frames_run[direction] = frames
-        
-        if not self.sprite_frames_run:
-            self.sprite_frames_run = None
-        
-        # idle animations
-        for direction in ['down', 'up', 'right', 'left']:
-            frames = self.load_strip('idle.png', direction, 8)
-            if frames:
-                self.sprite_frames_idle[direction] = frames
-        
-        if not self.sprite_frames_idle:
-            self.sprite_frames_idle = None
-        
+        self.sprite_frames = self.load_frames('walk.png')
+        self.sprite_frames_run = self.load_frames('run.png')
+        self.sprite_frames_idle = self.load_frames('idle.png')
+
+    def load_frames(self, filename):
+        """every direction of one sprite sheet in a flat list (DIR_ORDER),
+        or None if the sheet is missing. the sheet is loaded and scaled once
+        per run and all frames are sliced out of it in one go."""
+        key = (filename, self.size)
+        if key in _SHEET_CACHE:
+            return _SHEET_CACHE[key]
+
+        frames = None
+        path = f'{config.IMAGE_PATH}/lpc_male_animations_2026-02-05T00-35-56/standard/{filename}'
+        if os.path.exists(path):
+            frames = self._slice_sheet(pygame.image.load(path).convert_alpha())
+        _SHEET_CACHE[key] = frames
+        return frames
+
+    def _slice_sheet(self, grid):
+        """scale a loaded sheet to self.size and cut it into frames"""
+        frame_size = 64
+        cols = self.FRAMES_PER_DIR
+        # scale the used part of the sheet in one call, then hand out
+        # subsurfaces of it (they share the scaled pixels, no copies)
+        used = grid.subsurface((0, 0, cols * frame_size, grid.get_height()))
+        scale = self.size / frame_size
+        scaled = pygame.transform.scale(
+            used, (cols * self.size, int(grid.get_height() * scale)))
+        # make sure the frames are in display format so blitting them
+        # never has to convert pixels on the fly
+        scaled = scaled.convert_alpha()
+        return [
+            scaled.subsurface((i * self.size, row * self.size, self.size, self.size))
+            for row in SHEET_ROWS
+            for i in range(cols)
+        ]
+
     def move(self, dx, dy, tilemap, running=False):
         """move the player one tile, ignores input if still moving"""
         if self.moving:
@@ -512,6 +657,8 @@ class Player:
         elif dx > 0: self.direction = 'right'
         elif dy < 0: self.direction = 'up'
         elif dy > 0: self.direction = 'down'
+        self.dir_index = self.DIR_INDEX[self.direction]
+        self.frame_base = self.dir_index * self.FRAMES_PER_DIR
 
         next_tile_x = self.tile_x + dx
         next_tile_y = self.tile_y + dy
@@ -558,70 +705,75 @@ class Player:
 
         # 8 fps walk animation - runs continuously across tiles
         frame_rate = 14.0 if self.running else 8.0
-        self.animation_frame = int(self.anim_time * frame_rate) % 8
+        # always an int in 0..7, draw indexes with it directly
+        self.animation_frame = int(self.anim_time * frame_rate) % self.FRAMES_PER_DIR
     
     def draw(self, screen, camera_x, camera_y):
         """draw the player"""
         # use int so no blurry sub-pixel stuff
         # also center the sprite on the tile
-        screen_x = int(self.pixel_x - camera_x - (self.size - 32) // 2)
-        screen_y = int(self.pixel_y - camera_y - (self.size - 32))
-        
+        screen_x = int(self.pixel_x - camera_x - self.draw_off_x)
+        screen_y = int(self.pixel_y - camera_y - self.draw_off_y)
+
+        # nothing to do if the player is fully off screen
+        screen_w, screen_h = screen.get_size()
+        if (screen_x + self.size <= 0 or screen_y + self.size <= 0
+                or screen_x >= screen_w or screen_y >= screen_h):
+            return
+
         # draw sprite if we have one loaded
-        if self.sprite_frames and self.direction in self.sprite_frames:
-            current_frame = None
-            
+        if self.sprite_frames:
             # pick the right frame to show
             if self.moving:
-                if self.running and self.sprite_frames_run and self.direction in self.sprite_frames_run:
-                    frames = self.sprite_frames_run[self.direction]
-                    frame_index = int(self.animation_frame) % len(frames)
-                    current_frame = frames[frame_index]
-                else:
-                    frames = self.sprite_frames[self.direction]
-                    frame_index = int(self.animation_frame) % len(frames)
-                    current_frame = frames[frame_index]
+                frames = self.sprite_frames_run if self.running and self.sprite_frames_run else self.sprite_frames
+                current_frame = frames[self.frame_base + self.animation_frame]
             else:
                 # just stay on first frame when not moving
-                current_frame = self.sprite_frames[self.direction][0]
-            
-            if current_frame:
-                screen.blit(current_frame, (screen_x, screen_y))
-            else:
-                # fallback if something went wrong
-                self._draw_fallback_character(screen, screen_x, screen_y)
+                current_frame = self.sprite_frames[self.frame_base]
+
+            screen.blit(current_frame, (screen_x, screen_y))
         else:
             # no sprite loaded, use box guy
             self._draw_fallback_character(screen, screen_x, screen_y)
     
     def _draw_fallback_character(self, screen, screen_x, screen_y):
         """draw a simple box person if no sprite loaded"""
+        if self.fallback_poses is None:
+            self.fallback_poses = (self._make_fallback_pose(False),
+                                   self._make_fallback_pose(True))
+
+        # legs (animate them)
+        leg_offset = self.animation_frame if self.moving else 0
+        screen.blit(self.fallback_poses[leg_offset % 2], (screen_x, screen_y))
+
+    @staticmethod
+    def _make_fallback_pose(legs_apart):
+        """one frame of the box person, built once and reused"""
         # draw a simple stick figure type guy
         player_surf = pygame.Surface((32, 32))
         player_surf.fill((255, 0, 255))  # pink = transparent
-        player_surf.set_colorkey((255, 0, 255))
-        
+        player_surf.set_colorkey((255, 0, 255), pygame.RLEACCEL)
+
         # body
         body_color = config.BLUE
         pygame.draw.rect(player_surf, body_color, (8, 12, 16, 16))
-        
+
         # head
         pygame.draw.rect(player_surf, (255, 220, 177), (10, 6, 12, 10))
-        
+
         # eyes
         pygame.draw.rect(player_surf, config.BLACK, (12, 9, 2, 2))
         pygame.draw.rect(player_surf, config.BLACK, (18, 9, 2, 2))
-        
-        # legs (animate them)
-        leg_offset = int(self.animation_frame) if self.moving else 0
-        if leg_offset % 2 == 0:
+
+        # legs
+        if not legs_apart:
             pygame.draw.rect(player_surf, body_color, (10, 28, 4, 4))
             pygame.draw.rect(player_surf, body_color, (18, 28, 4, 4))
         else:
             pygame.draw.rect(player_surf, body_color, (8, 28, 4, 4))
             pygame.draw.rect(player_surf, body_color, (20, 28, 4, 4))
-        
+
         # outline
         pygame.draw.rect(player_surf, config.BLACK, (8, 6, 16, 26), 2)
-        
-        screen.blit(player_surf, (screen_x, screen_y))
\ No newline at end of file
+
+        return player_surf